@@ -1,114 +1,643 @@
+import atexit
+import bisect
+import functools
 import json
 import os
+import queue
+import re
+import threading
+import uuid
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
+from datetime import date, datetime
+from operator import attrgetter
+
+# Use orjson for faster (de)serialization when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use ijson to stream-parse very large task files when it is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Task files bigger than this are stream-parsed instead of read whole
+STREAM_LOAD_THRESHOLD = 10 * 1024 * 1024
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent=False):
+    # Always returns bytes so callers can write to binary files
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Due dates are always written as YYYY-MM-DD
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+def parse_due_date(value):
+    # Much cheaper than strptime; raises ValueError for anything else
+    if not isinstance(value, str) or not DATE_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid date: {value!r}")
+    return date.fromisoformat(value)
+
+# Many tasks share a due date, so each distinct one is only parsed once;
+# `value` must be a string
+@functools.lru_cache(maxsize=4096)
+def due_date_key(value):
+    try:
+        return parse_due_date(value)
+    except ValueError:
+        pass
+    try:
+        # Older versions accepted unpadded dates like 2026-4-1
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        # Unparseable dates sort after every valid one
+        return date.max
+
+# Custom priority order: High > Medium > Low, unknown priorities last
+PRIORITY_ORDER = {"High": 1, "Medium": 2, "Low": 3}
+
+# Sort keys for each sortable field, precomputed on every Task
+SORT_KEYS = {
+    "name": attrgetter("_name_lower"),
+    "priority": attrgetter("_priority_rank"),
+    "due_date": attrgetter("_due_key")
+}
+
+# Task tree columns: (column, heading, width, anchor, sort key)
+TREE_COLUMNS = [
+    ("ID", "#", 30, tk.CENTER, None),
+    ("Name", "Name", 150, tk.W, "name"),
+    ("Description", "Description", 300, tk.W, None),
+    ("Priority", "Priority", 100, tk.CENTER, "priority"),
+    ("Due Date", "Due Date", 100, tk.CENTER, "due_date")
+]
+
+# Task fields shown after the "#" column, fetched in a single call
+ROW_FIELDS = attrgetter("name", "description", "priority", "due_date")
+
+# Number of rows inserted into the task tree at a time
+RENDER_BATCH_SIZE = 100
+
+# How often the GUI checks whether the tasks have finished loading
+LOAD_POLL_MS = 50
+
+# Delay before live filtering runs after the last keystroke
+FILTER_DELAY_MS = 150
 
 # Define the Task class to represent each task
 class Task:
-    def __init__(self, name, description, priority, due_date):
+    # Slots keep per-task memory down and make attribute access cheaper
+    __slots__ = ("id", "name", "description", "priority", "due_date",
+                 "_name_lower", "_priority_rank", "_due_key",
+                 "_dict_cache", "_json_cache")
+
+    def __init__(self, name, description, priority, due_date, task_id=None):
+        # Stable identifier, independent of the task's position in the list
+        self.id = task_id or uuid.uuid4().hex
         self.name = name
         self.description = description
         self.priority = priority
         self.due_date = due_date
+        # Precompute sort keys so sorting doesn't rebuild them per task
+        self._name_lower = name.lower()
+        self._priority_rank = PRIORITY_ORDER.get(priority, 4)
+        # Parse the due date once so sorting doesn't parse it per task
+        self._due_key = due_date_key(due_date) if isinstance(due_date, str) else date.max
+        # Serialized forms are built on first use; edits create a new Task
+        self._dict_cache = None
+        self._json_cache = None
+
+    def set_id(self, task_id):
+        self.id = task_id
+        self._dict_cache = None
+        self._json_cache = None
 
     def to_dict(self):
-        return {
-            "name": self.name,
-            "description": self.description,
-            "priority": self.priority,
-            "due_date": self.due_date
-        }
+        # The returned dict is shared, callers must not modify it
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "name": self.name,
+                "description": self.description,
+                "priority": self.priority,
+                "due_date": self.due_date
+            }
+        return self._dict_cache
+
+    def to_json(self):
+        if self._json_cache is None:
+            self._json_cache = json_dumps(self.to_dict())
+        return self._json_cache
+
+    @classmethod
+    def from_dict(cls, task_dict):
+        return cls(
+            task_dict["name"],
+            task_dict["description"],
+            task_dict["priority"],
+            task_dict["due_date"],
+            task_dict.get("id")
+        )
 
 # Define the TaskManager class to handle task operations
 class TaskManager:
-    def __init__(self, json_file='tasks.json'):
+    def __init__(self, json_file='tasks.json', compact_every=100, pretty_json=False):
         self.tasks = []
         self.json_file = json_file
+        # Indented output is easier to read when debugging but larger on disk
+        self.pretty_json = pretty_json
+        # Mutations are appended to a journal next to the snapshot file and
+        # folded back into the snapshot every `compact_every` entries
+        self.journal_file = os.path.splitext(json_file)[0] + '.log'
+        self.journal_entries = 0
+        self.compact_every = compact_every
+        # While a snapshot is swapped in, the journal it replaces is kept
+        # here so a crash part way through can be told apart on load
+        self.old_journal_file = self.journal_file + '.old'
+        # All file writes happen on a background thread fed by this queue
+        self._save_q = queue.Queue()
+        self._saver_thread = threading.Thread(target=self._saver, daemon=True)
+        self._saver_thread.start()
+        # Tasks by id, plus grouped by priority and by due date in list order;
+        # sorting only marks the groups dirty and filtering rebuilds them
+        self._tasks_by_id = {}
+        self._by_priority = {}
+        self._by_due_date = {}
+        self._indexes_dirty = True
+        # Sorted orderings keyed by (sort_key, reverse), valid while the
+        # task list is unchanged; `_version` is bumped on every mutation
+        self._version = 0
+        self._sort_cache = {}
+        self._sort_cache_version = 0
+        # (sort_key, reverse) of the last sort; while set, new and edited
+        # tasks are inserted in sorted position instead of appended
+        self._active_sort = None
         self.load_tasks_from_json()
+        atexit.register(self.close)
 
     def load_tasks_from_json(self):
         try:
+            self._finish_snapshot_swap()
             if os.path.exists(self.json_file):
-                with open(self.json_file, 'r') as file:
-                    task_dicts = json.load(file)
-                    self.tasks = [Task(
-                        task_dict["name"],
-                        task_dict["description"],
-                        task_dict["priority"],
-                        task_dict["due_date"]
-                    ) for task_dict in task_dicts]
+                with open(self.json_file, 'rb') as file:
+                    if ijson is not None and os.path.getsize(self.json_file) > STREAM_LOAD_THRESHOLD:
+                        # Build tasks while parsing instead of holding every dict first
+                        task_dicts = ijson.items(file, 'item')
+                    else:
+                        task_dicts = json_loads(file.read())
+                    self.tasks = []
+                    missing_ids = False
+                    for task_dict in task_dicts:
+                        missing_ids = missing_ids or "id" not in task_dict
+                        self.tasks.append(Task.from_dict(task_dict))
                 print(f"Loaded {len(self.tasks)} tasks from '{self.json_file}'.")
             else:
                 self.tasks = []
+                missing_ids = False
                 print(f"No existing tasks file found. Starting with empty task list.")
+            self._tasks_by_id = {task.id: task for task in self.tasks}
+            # The indexes are built on the first filter, not on every load
+            self._invalidate_indexes()
+            replayed = self.replay_journal()
+            # Files from before tasks had ids get them written out right away,
+            # since journal entries refer to tasks by id
+            if replayed or missing_ids:
+                self.compact()
         except json.JSONDecodeError:
             print(f"Error: The file '{self.json_file}' is not a valid JSON file.")
             self.tasks = []
+            self._tasks_by_id = {}
         except Exception as e:
             print(f"Error loading tasks: {str(e)}")
             self.tasks = []
+            self._tasks_by_id = {}
+            self._invalidate_indexes()
+        self._active_sort = None
+
+    def _finish_snapshot_swap(self):
+        # An old journal means the last snapshot write was interrupted. Its
+        # temporary file was complete before the journal was set aside, so
+        # either swap it in now or, if that already happened, just drop the
+        # old journal; its changes are in the snapshot either way
+        if not os.path.exists(self.old_journal_file):
+            return
+        tmp_file = self.json_file + '.tmp'
+        if os.path.exists(tmp_file):
+            os.replace(tmp_file, self.json_file)
+        os.remove(self.old_journal_file)
 
     def save_tasks_to_json(self):
+        # Serialize on the calling thread, the writer thread does the I/O
+        self._check_open()
         try:
-            with open(self.json_file, 'w') as file:
-                task_dicts = [task.to_dict() for task in self.tasks]
-                json.dump(task_dicts, file, indent=2)
+            if self.pretty_json:
+                data = json_dumps([task.to_dict() for task in self.tasks], indent=True)
+            else:
+                # Join each task's cached JSON instead of re-encoding every task
+                data = b"[" + b",".join([task.to_json() for task in self.tasks]) + b"]"
+            self._save_q.put(("snapshot", data))
             return True
         except Exception as e:
             print(f"Error saving tasks: {str(e)}")
             return False
 
+    def _check_open(self):
+        # Nothing is written once the writer thread has stopped, so refuse
+        # rather than silently dropping the change
+        if self._saver_thread is None:
+            raise RuntimeError("TaskManager is closed, changes can no longer be saved")
+
+    def _write_snapshot(self, data):
+        # Replaces the snapshot and retires the journal it contains
+        tmp_file = self.json_file + '.tmp'
+        try:
+            # Write to a temporary file first so a crash can't corrupt the snapshot
+            with open(tmp_file, 'wb') as file:
+                file.write(data)
+            # Set the journal aside before the swap; see _finish_snapshot_swap
+            if os.path.exists(self.journal_file):
+                os.replace(self.journal_file, self.old_journal_file)
+            os.replace(tmp_file, self.json_file)
+        except Exception as e:
+            print(f"Error saving tasks: {str(e)}")
+            try:
+                # The snapshot was not swapped in, so its journal is still needed
+                if os.path.exists(self.old_journal_file):
+                    os.replace(self.old_journal_file, self.journal_file)
+            except Exception as e:
+                print(f"Error restoring journal: {str(e)}")
+            return False
+        try:
+            if os.path.exists(self.old_journal_file):
+                os.remove(self.old_journal_file)
+        except Exception as e:
+            print(f"Error clearing journal: {str(e)}")
+        return True
+
+    def _saver(self):
+        journal = None
+        running = True
+        while running:
+            # Take everything that is pending so writes can be coalesced
+            items = [self._save_q.get()]
+            while True:
+                try:
+                    items.append(self._save_q.get_nowait())
+                except queue.Empty:
+                    break
+            # Writes queued around the stop sentinel are still carried out
+            pending = len(items)
+            if None in items:
+                running = False
+                items = [item for item in items if item is not None]
+            
+            # Only the latest snapshot needs writing, and it already contains
+            # every journal entry queued before it
+            lines = [data for kind, data in items if kind == "journal"]
+            snapshots = [i for i, (kind, data) in enumerate(items) if kind == "snapshot"]
+            if snapshots:
+                # The journal is moved aside while the snapshot is swapped in
+                if journal is not None:
+                    journal.close()
+                    journal = None
+                if self._write_snapshot(items[snapshots[-1]][1]):
+                    lines = [data for kind, data in items[snapshots[-1] + 1:] if kind == "journal"]
+            
+            if lines:
+                try:
+                    if journal is None:
+                        journal = open(self.journal_file, 'ab')
+                    journal.write(b"".join(lines))
+                    journal.flush()
+                except Exception as e:
+                    print(f"Error writing journal: {str(e)}")
+            
+            for _ in range(pending):
+                self._save_q.task_done()
+        if journal is not None:
+            journal.close()
+
+    def flush(self):
+        # Block until every queued write has reached the disk
+        self._save_q.join()
+
+    def replay_journal(self):
+        # Re-apply mutations recorded since the last snapshot was written
+        if not os.path.exists(self.journal_file):
+            return False
+        replayed = 0
+        try:
+            with open(self.journal_file, 'rb') as file:
+                for line in file:
+                    if line.strip():
+                        self.apply_journal_entry(json_loads(line))
+                        replayed += 1
+        except Exception as e:
+            # A crash can leave a partially written last line behind
+            print(f"Error replaying journal: {str(e)}")
+        if replayed:
+            print(f"Replayed {replayed} changes from '{self.journal_file}'.")
+        # The caller folds the journal into a new snapshot
+        return True
+
+    def apply_journal_entry(self, entry):
+        op = entry["op"]
+        if op == "add":
+            task = Task.from_dict(entry["task"])
+            if task.id not in self._tasks_by_id:
+                self._add(task, entry.get("index"))
+        elif op == "update":
+            self._update(entry["id"], Task.from_dict(entry["task"]), entry.get("index"))
+        elif op == "delete":
+            self._delete(entry["id"])
+        elif op == "sort":
+            self._sort(entry["key"], entry["reverse"])
+
+    def write_journal(self, entry):
+        self._check_open()
+        try:
+            self._save_q.put(("journal", json_dumps(entry) + b"\n"))
+            self.journal_entries += 1
+        except Exception as e:
+            print(f"Error writing journal: {str(e)}")
+            # Fall back to writing a full snapshot
+            return self.compact()
+        if self.journal_entries >= self.compact_every:
+            return self.compact()
+        return True
+
+    def compact(self):
+        # Queue a full snapshot; the writer thread then starts a fresh journal
+        if not self.save_tasks_to_json():
+            return False
+        self.journal_entries = 0
+        # Replaying the new journal starts with no cached sort orders,
+        # so drop them here too to keep sort results identical
+        self._version += 1
+        return True
+
+    def close(self):
+        # Write out pending changes and stop the writer thread
+        if self._saver_thread is None:
+            return
+        if self.journal_entries:
+            self.compact()
+        # Refuse new writes before the writer is told to stop
+        saver_thread, self._saver_thread = self._saver_thread, None
+        self._save_q.put(None)
+        saver_thread.join()
+
+    def _indexes(self):
+        return ((self._by_priority, 'priority'), (self._by_due_date, 'due_date'))
+
+    def _rebuild_indexes(self):
+        by_priority = {}
+        by_due_date = {}
+        for task in self.tasks:
+            by_priority.setdefault(task.priority, []).append(task)
+            by_due_date.setdefault(task.due_date, []).append(task)
+        self._by_priority = by_priority
+        self._by_due_date = by_due_date
+        self._indexes_dirty = False
+
+    def _invalidate_indexes(self):
+        self._by_priority = {}
+        self._by_due_date = {}
+        self._indexes_dirty = True
+
+    def _index_task(self, task):
+        # Only valid for tasks appended to the end of the task list
+        if self._indexes_dirty:
+            return
+        for index, field in self._indexes():
+            index.setdefault(getattr(task, field), []).append(task)
+
+    def _index_inserted_task(self, task, position):
+        if self._indexes_dirty:
+            return
+        if position == len(self.tasks) - 1:
+            self._index_task(task)
+            return
+        if self._active_sort is None:
+            # Finding the task's place in each bucket would mean scanning
+            # the task list, so rebuild the groups when next filtered on
+            self._invalidate_indexes()
+            return
+        for index, field in self._indexes():
+            bucket = index.setdefault(getattr(task, field), [])
+            # Buckets are subsequences of the sorted list, so sorted too
+            bucket.insert(self._sorted_position(bucket, task), task)
+
+    def _sorted_position(self, tasks, task):
+        # Where `task` goes in `tasks` under the active sort, after equal keys,
+        # which is where a stable re-sort would put it
+        sort_key, reverse = self._active_sort
+        key = SORT_KEYS[sort_key]
+        if not reverse:
+            return bisect.bisect_right(tasks, key(task), key=key)
+        value = key(task)
+        lo, hi = 0, len(tasks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key(tasks[mid]) < value:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _unindex_task(self, task):
+        if self._indexes_dirty:
+            return
+        for index, field in self._indexes():
+            key = getattr(task, field)
+            bucket = index[key]
+            bucket.remove(task)
+            if not bucket:
+                del index[key]
+
+    def _reindex_task(self, old_task, new_task):
+        if self._indexes_dirty:
+            return
+        for _, field in self._indexes():
+            if getattr(old_task, field) != getattr(new_task, field):
+                # Keeping the new bucket in list order would need a scan
+                # of the task list, so rebuild the groups when next filtered on
+                self._invalidate_indexes()
+                return
+        for index, field in self._indexes():
+            bucket = index[getattr(old_task, field)]
+            bucket[bucket.index(old_task)] = new_task
+
+    def get_task(self, task_id):
+        return self._tasks_by_id.get(task_id)
+
+    def _add(self, task, position=None):
+        if position is None:
+            if self._active_sort is not None:
+                position = self._sorted_position(self.tasks, task)
+            else:
+                position = len(self.tasks)
+        self.tasks.insert(position, task)
+        self._tasks_by_id[task.id] = task
+        self._index_inserted_task(task, position)
+        self._version += 1
+        return position
+
+    def _update(self, task_id, task, position=None):
+        old_task = self._tasks_by_id.get(task_id)
+        if old_task is None:
+            return None
+        # The replacement keeps the original task's id
+        if task.id != task_id:
+            task.set_id(task_id)
+        old_position = self.tasks.index(old_task)
+        del self.tasks[old_position]
+        if position is None:
+            position = old_position
+            if self._active_sort is not None:
+                key = SORT_KEYS[self._active_sort[0]]
+                if key(old_task) != key(task):
+                    # Reinsert in sorted position to keep the active sort order
+                    position = self._sorted_position(self.tasks, task)
+        self.tasks.insert(position, task)
+        self._tasks_by_id[task_id] = task
+        if position == old_position:
+            self._reindex_task(old_task, task)
+        else:
+            self._unindex_task(old_task)
+            self._index_inserted_task(task, position)
+        self._version += 1
+        return position
+
+    def _delete(self, task_id):
+        task = self._tasks_by_id.pop(task_id, None)
+        if task is None:
+            return False
+        self.tasks.remove(task)
+        self._unindex_task(task)
+        self._version += 1
+        return True
+
     def add_task(self, task):
-        self.tasks.append(task)
-        self.save_tasks_to_json()
+        position = self._add(task)
+        self.write_journal({"op": "add", "index": position, "task": task.to_dict()})
 
-    def update_task(self, index, task):
-        if 0 <= index < len(self.tasks):
-            self.tasks[index] = task
-            self.save_tasks_to_json()
+    def update_task(self, task_id, task):
+        old_task = self._tasks_by_id.get(task_id)
+        if old_task is None:
+            return False
+        # Nothing to save when the task was submitted without changes
+        if task.id != task_id:
+            task.set_id(task_id)
+        if old_task.to_dict() == task.to_dict():
+            return True
+        position = self._update(task_id, task)
+        if position is not None:
+            self.write_journal({"op": "update", "id": task_id, "index": position, "task": task.to_dict()})
             return True
         return False
 
-    def delete_task(self, index):
-        if 0 <= index < len(self.tasks):
-            self.tasks.pop(index)
-            self.save_tasks_to_json()
+    def delete_task(self, task_id):
+        if self._delete(task_id):
+            self.write_journal({"op": "delete", "id": task_id})
             return True
         return False
 
     def get_filtered_tasks(self, name_filter=None, priority_filter=None, due_date_filter=None):
-        filtered_tasks = self.tasks.copy()
-        
-        if name_filter and name_filter.strip():
-            filtered_tasks = [task for task in filtered_tasks if name_filter.lower() in task.name.lower()]
-        
-        if priority_filter and priority_filter != "All":
-            filtered_tasks = [task for task in filtered_tasks if task.priority == priority_filter]
+        # Work out which filters are active once, then filter in a single pass
+        name_filter = name_filter.lower() if name_filter and name_filter.strip() else ""
+        if priority_filter == "All":
+            priority_filter = None
+        if not (due_date_filter and due_date_filter.strip()):
+            due_date_filter = None
         
-        if due_date_filter and due_date_filter.strip():
-            filtered_tasks = [task for task in filtered_tasks if task.due_date == due_date_filter]
+        # Start from the smallest matching index bucket instead of every task
+        if (priority_filter or due_date_filter) and self._indexes_dirty:
+            self._rebuild_indexes()
+        candidates = self.tasks
+        if priority_filter:
+            candidates = self._by_priority.get(priority_filter, [])
+        if due_date_filter:
+            by_date = self._by_due_date.get(due_date_filter, [])
+            if len(by_date) < len(candidates):
+                candidates = by_date
         
-        return filtered_tasks
+        return [task for task in candidates
+                if (not name_filter or name_filter in task._name_lower)
+                and (not priority_filter or task.priority == priority_filter)
+                and (not due_date_filter or task.due_date == due_date_filter)]
 
     def sort_tasks(self, sort_key='name', reverse=False):
-        if sort_key == 'name':
-            self.tasks.sort(key=lambda task: task.name.lower(), reverse=reverse)
-        elif sort_key == 'priority':
-            # Custom priority order: High > Medium > Low
-            priority_order = {"High": 1, "Medium": 2, "Low": 3}
-            self.tasks.sort(key=lambda task: priority_order.get(task.priority, 4), reverse=reverse)
-        elif sort_key == 'due_date':
-            self.tasks.sort(key=lambda task: datetime.strptime(task.due_date, "%Y-%m-%d"), reverse=reverse)
+        self._sort(sort_key, reverse)
+        # The journal records sorts so replaying it restores the same order
+        self.write_journal({"op": "sort", "key": sort_key, "reverse": reverse})
         return self.tasks
 
+    def _sort(self, sort_key, reverse):
+        if self._sort_cache_version != self._version:
+            self._sort_cache = {}
+            self._sort_cache_version = self._version
+        
+        # Every ordering is a new list that is shared with the cache, so
+        # a cache hit costs nothing. Mutating the shared list is safe because
+        # it bumps `_version` and so drops the cache.
+        if (sort_key, reverse) in self._sort_cache:
+            self.tasks = self._sort_cache[(sort_key, reverse)]
+        else:
+            if (sort_key, not reverse) in self._sort_cache:
+                # Mirror the opposite ordering instead of sorting again
+                self.tasks = self._sort_cache[(sort_key, not reverse)][::-1]
+            elif sort_key == 'priority':
+                self.tasks = self._sort_by_priority(reverse)
+            elif sort_key in SORT_KEYS:
+                self.tasks = sorted(self.tasks, key=SORT_KEYS[sort_key], reverse=reverse)
+            else:
+                return
+            self._sort_cache[(sort_key, reverse)] = self.tasks
+        self._active_sort = (sort_key, reverse)
+        # The groups follow list order, rebuild them when next filtered on
+        self._invalidate_indexes()
+
+    def _sort_by_priority(self, reverse):
+        # Only a handful of ranks exist, so distribute tasks into one bucket
+        # per rank instead of comparing them; each bucket stays in list order
+        # just like a stable sort
+        buckets = {rank: [] for rank in (1, 2, 3, 4)}
+        for task in self.tasks:
+            buckets[task._priority_rank].append(task)
+        ranks = sorted(buckets, reverse=reverse)
+        return [task for rank in ranks for task in buckets[rank]]
+
 # Define the TaskManagerGUI class to create the Tkinter interface
 class TaskManagerGUI:
     def __init__(self, root):
         self.root = root
-        self.task_manager = TaskManager()
+        # Tasks are loaded on a background thread, see poll_load_queue
+        self.task_manager = None
+        # Tree rows use the task id as their item ID, so single rows can be updated
+        self.showing_all = True
+        self.filtered_tasks = None
+        self.rendered_count = 0
+        # Pending `after` callback for live filtering while typing, and the
+        # (name, priority, due date) filter values last applied
+        self._filter_after_id = None
+        self._applied_filter = None
+        # Id of the task being edited in the task dialog, None when adding
+        self.editing_task_id = None
         self.setup_gui()
-        self.populate_tree()
+        self.task_dialog = self.build_task_dialog()
+        self.start_loading()
         
         # Track sorting state
         self.sort_columns = {
@@ -159,34 +688,33 @@ class TaskManagerGUI:
         self.clear_button = ttk.Button(filter_frame, text="Clear Filter", command=self.clear_filter)
         self.clear_button.grid(row=0, column=7, padx=5, pady=5)
         
+        # Filter as the user types, coalescing bursts of keystrokes
+        self.name_filter.bind("<KeyRelease>", self.schedule_filter)
+        self.due_date_filter.bind("<KeyRelease>", self.schedule_filter)
+        self.priority_filter.bind("<<ComboboxSelected>>", self.schedule_filter)
+        
         # Create task treeview
         tree_frame = ttk.Frame(main_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # Create scrollbars
-        y_scrollbar = ttk.Scrollbar(tree_frame)
-        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.y_scrollbar = ttk.Scrollbar(tree_frame)
+        self.y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Create Treeview
-        self.tree = ttk.Treeview(tree_frame, columns=("ID", "Name", "Description", "Priority", "Due Date"), 
-                                show="headings", yscrollcommand=y_scrollbar.set)
+        self.tree = ttk.Treeview(tree_frame, columns=[column[0] for column in TREE_COLUMNS], 
+                                show="headings", yscrollcommand=self.on_tree_scroll)
         
         # Configure scrollbars
-        y_scrollbar.config(command=self.tree.yview)
-        
-        # Configure column headings
-        self.tree.heading("ID", text="#", command=lambda: self.on_column_click("ID"))
-        self.tree.heading("Name", text="Name", command=lambda: self.on_column_click("name"))
-        self.tree.heading("Description", text="Description")
-        self.tree.heading("Priority", text="Priority", command=lambda: self.on_column_click("priority"))
-        self.tree.heading("Due Date", text="Due Date", command=lambda: self.on_column_click("due_date"))
-        
-        # Configure column widths
-        self.tree.column("ID", width=30, anchor=tk.CENTER)
-        self.tree.column("Name", width=150, anchor=tk.W)
-        self.tree.column("Description", width=300, anchor=tk.W)
-        self.tree.column("Priority", width=100, anchor=tk.CENTER)
-        self.tree.column("Due Date", width=100, anchor=tk.CENTER)
+        self.y_scrollbar.config(command=self.tree.yview)
+        
+        # Configure column headings and widths
+        for column, heading, width, anchor, sort_key in TREE_COLUMNS:
+            if sort_key:
+                self.tree.heading(column, text=heading, command=lambda key=sort_key: self.on_column_click(key))
+            else:
+                self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor=anchor)
         
         self.tree.pack(fill=tk.BOTH, expand=True)
         
@@ -221,23 +749,143 @@ class TaskManagerGUI:
                                           command=lambda: self.sort_tasks("due_date"))
         self.sort_date_button.grid(row=0, column=2, padx=5, pady=5)
 
+    def start_loading(self):
+        # Show the window straight away with a placeholder row and keep the
+        # controls disabled until the tasks have been loaded
+        self.tree.insert("", "end", values=("", "Loading tasks...", "", "", ""))
+        for button in self.task_buttons():
+            button.state(["disabled"])
+        
+        self._load_q = queue.Queue()
+        threading.Thread(target=lambda: self._load_q.put(TaskManager()), daemon=True).start()
+        self.root.after(LOAD_POLL_MS, self.poll_load_queue)
+
+    def poll_load_queue(self):
+        # Tk widgets may only be touched from the main thread, so the loader
+        # hands the TaskManager over through a queue
+        try:
+            self.task_manager = self._load_q.get_nowait()
+        except queue.Empty:
+            self.root.after(LOAD_POLL_MS, self.poll_load_queue)
+            return
+        for button in self.task_buttons():
+            button.state(["!disabled"])
+        # Honour anything typed into the filters while loading
+        self.apply_filter()
+
+    def task_buttons(self):
+        return (self.filter_button, self.clear_button, self.add_button, self.edit_button,
+                self.delete_button, self.sort_name_button, self.sort_priority_button,
+                self.sort_date_button)
+
     def populate_tree(self, tasks=None):
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in a single Tk call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
         
-        # Use provided tasks or get all tasks
-        if tasks is None:
-            tasks = self.task_manager.tasks
+        # Use provided tasks or show all tasks
+        self.showing_all = tasks is None
+        self.filtered_tasks = tasks
         
-        # Add tasks to treeview
-        for i, task in enumerate(tasks, 1):
-            self.tree.insert("", "end", values=(i, task.name, task.description, task.priority, task.due_date))
+        # Only the first batch is inserted, the rest follows on scroll
+        self.rendered_count = 0
+        self.render_more_rows()
+
+    def displayed_tasks(self):
+        if self.showing_all:
+            return self.task_manager.tasks
+        return self.filtered_tasks
+
+    def render_more_rows(self):
+        tasks = self.displayed_tasks()
+        end = min(self.rendered_count + RENDER_BATCH_SIZE, len(tasks))
+        for i in range(self.rendered_count, end):
+            task = tasks[i]
+            self.tree.insert("", "end", iid=task.id, values=self.row_values(i + 1, task))
+        self.rendered_count = end
+
+    def on_tree_scroll(self, first, last):
+        self.y_scrollbar.set(first, last)
+        if self.task_manager is None:
+            return  # Still loading, only the placeholder row is shown
+        # Render the next batch once the view gets near the last rendered row
+        if float(last) > 0.9 and self.rendered_count < len(self.displayed_tasks()):
+            self.render_more_rows()
+
+    def row_values(self, number, task):
+        return (number, *ROW_FIELDS(task))
+
+    def insert_task_row(self, task):
+        # Insert a row for a newly added task without rebuilding the tree
+        if not self.showing_all:
+            self.populate_tree()
+            return
+        tasks = self.task_manager.tasks
+        index = tasks.index(task)
+        # Rows past the rendered batch show up when scrolled to
+        if index < self.rendered_count or self.rendered_count == len(tasks) - 1:
+            self.tree.insert("", index, iid=task.id, values=self.row_values(index + 1, task))
+            self.rendered_count += 1
+            self.renumber_rows(index + 1)
+
+    def update_task_row(self, task):
+        if not self.showing_all:
+            self.populate_tree()
+            return
+        if self.tree.exists(task.id):
+            index = self.tree.index(task.id)
+            if self.task_manager.tasks[index] is task:
+                self.tree.item(task.id, values=self.row_values(index + 1, task))
+                return
+            # The task moved to keep the list sorted
+            self.tree.delete(task.id)
+            self.rendered_count -= 1
+            self.renumber_rows(index)
+        self.insert_task_row(task)
+
+    def remove_task_row(self, task_id):
+        if not self.showing_all:
+            self.populate_tree()
+            return
+        if not self.tree.exists(task_id):
+            return
+        index = self.tree.index(task_id)
+        self.tree.delete(task_id)
+        self.rendered_count -= 1
+        self.renumber_rows(index)
+
+    def renumber_rows(self, start):
+        # Update the "#" column of rendered rows from `start` onwards
+        for number, iid in enumerate(self.tree.get_children()[start:], start + 1):
+            self.tree.set(iid, "ID", number)
+
+    def current_filter(self):
+        return (self.name_filter.get(), self.priority_filter.get(), self.due_date_filter.get())
+
+    def schedule_filter(self, event=None):
+        self.cancel_scheduled_filter()
+        # Keys like arrows, Shift or Ctrl+C don't change what is filtered on
+        if self.current_filter() == self._applied_filter:
+            return
+        self._filter_after_id = self.root.after(FILTER_DELAY_MS, self.apply_filter)
+
+    def cancel_scheduled_filter(self):
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
 
     def apply_filter(self):
-        name_filter = self.name_filter.get()
-        priority_filter = self.priority_filter.get()
-        due_date_filter = self.due_date_filter.get()
+        self.cancel_scheduled_filter()
+        if self.task_manager is None:
+            return  # Still loading
+        self._applied_filter = self.current_filter()
+        name_filter, priority_filter, due_date_filter = self._applied_filter
+        
+        # Empty filters show the full list, which keeps row updates incremental
+        if not name_filter.strip() and priority_filter == "All" and not due_date_filter.strip():
+            self.populate_tree()
+            return
         
         filtered_tasks = self.task_manager.get_filtered_tasks(
             name_filter, 
@@ -248,14 +896,18 @@ class TaskManagerGUI:
         self.populate_tree(filtered_tasks)
 
     def clear_filter(self):
+        self.cancel_scheduled_filter()
         self.name_filter.delete(0, tk.END)
         self.priority_filter.current(0)
         self.due_date_filter.delete(0, tk.END)
+        self._applied_filter = self.current_filter()
         self.populate_tree()
 
     def on_column_click(self, column):
         if column == "ID":
             return  # Don't sort by ID column
+        if self.task_manager is None:
+            return  # Still loading
         
         # Toggle sort order
         if self.sort_columns[column]["order"] == "":
@@ -298,74 +950,67 @@ class TaskManagerGUI:
         self.task_manager.sort_tasks(sort_key, reverse)
         self.populate_tree()
 
-    def add_task_dialog(self):
-        # Create a dialog window for adding a task
+    def build_task_dialog(self):
+        # The add and edit dialogs share one window that is built once and
+        # hidden between uses, instead of recreating every widget each time
         dialog = tk.Toplevel(self.root)
-        dialog.title("Add New Task")
+        dialog.withdraw()
         dialog.geometry("400x300")
         dialog.resizable(False, False)
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self.hide_task_dialog)
         
         # Create form elements
         ttk.Label(dialog, text="Task Name:").grid(row=0, column=0, padx=10, pady=10, sticky=tk.W)
-        name_entry = ttk.Entry(dialog, width=30)
-        name_entry.grid(row=0, column=1, padx=10, pady=10)
+        self.name_entry = ttk.Entry(dialog, width=30)
+        self.name_entry.grid(row=0, column=1, padx=10, pady=10)
         
         ttk.Label(dialog, text="Description:").grid(row=1, column=0, padx=10, pady=10, sticky=tk.W)
-        desc_entry = tk.Text(dialog, width=30, height=5)
-        desc_entry.grid(row=1, column=1, padx=10, pady=10)
+        self.desc_entry = tk.Text(dialog, width=30, height=5)
+        self.desc_entry.grid(row=1, column=1, padx=10, pady=10)
         
         ttk.Label(dialog, text="Priority:").grid(row=2, column=0, padx=10, pady=10, sticky=tk.W)
-        priority_combo = ttk.Combobox(dialog, values=["High", "Medium", "Low"], width=10)
-        priority_combo.current(1)  # Default to Medium
-        priority_combo.grid(row=2, column=1, padx=10, pady=10, sticky=tk.W)
+        self.priority_combo = ttk.Combobox(dialog, values=["High", "Medium", "Low"], width=10)
+        self.priority_combo.grid(row=2, column=1, padx=10, pady=10, sticky=tk.W)
         
         ttk.Label(dialog, text="Due Date (YYYY-MM-DD):").grid(row=3, column=0, padx=10, pady=10, sticky=tk.W)
-        date_entry = ttk.Entry(dialog, width=15)
-        date_entry.grid(row=3, column=1, padx=10, pady=10, sticky=tk.W)
-        
-        def validate_and_save():
-            # Get form values
-            name = name_entry.get().strip()
-            description = desc_entry.get("1.0", tk.END).strip()
-            priority = priority_combo.get()
-            due_date = date_entry.get().strip()
-            
-            # Validate input
-            if not name:
-                messagebox.showerror("Input Error", "Task name cannot be empty!")
-                return
-            
-            if not priority in ["High", "Medium", "Low"]:
-                messagebox.showerror("Input Error", "Invalid priority level!")
-                return
-            
-            # Validate date format
-            try:
-                if due_date:
-                    datetime.strptime(due_date, "%Y-%m-%d")
-                else:
-                    messagebox.showerror("Input Error", "Due date cannot be empty!")
-                    return
-            except ValueError:
-                messagebox.showerror("Input Error", "Invalid date format! Use YYYY-MM-DD.")
-                return
-            
-            # Create and add the task
-            new_task = Task(name, description, priority, due_date)
-            self.task_manager.add_task(new_task)
-            
-            # Refresh the tree and close the dialog
-            self.populate_tree()
-            dialog.destroy()
+        self.date_entry = ttk.Entry(dialog, width=15)
+        self.date_entry.grid(row=3, column=1, padx=10, pady=10, sticky=tk.W)
         
         # Add buttons
         button_frame = ttk.Frame(dialog)
         button_frame.grid(row=4, column=0, columnspan=2, pady=20)
         
-        ttk.Button(button_frame, text="Save", command=validate_and_save).pack(side=tk.LEFT, padx=10)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=10)
+        self.dialog_save_button = ttk.Button(button_frame, text="Save", command=self.submit_task_dialog)
+        self.dialog_save_button.pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="Cancel", command=self.hide_task_dialog).pack(side=tk.LEFT, padx=10)
+        return dialog
+
+    def show_task_dialog(self, title, button_text, task=None):
+        # Reset the form, filling it in from `task` when editing
+        self.name_entry.delete(0, tk.END)
+        self.desc_entry.delete("1.0", tk.END)
+        self.date_entry.delete(0, tk.END)
+        if task is None:
+            self.priority_combo.current(1)  # Default to Medium
+        else:
+            self.name_entry.insert(0, task.name)
+            self.desc_entry.insert("1.0", task.description)
+            self.priority_combo.set(task.priority)
+            self.date_entry.insert(0, task.due_date)
+        
+        self.task_dialog.title(title)
+        self.dialog_save_button.config(text=button_text)
+        self.task_dialog.deiconify()
+        self.task_dialog.grab_set()
+
+    def hide_task_dialog(self):
+        self.task_dialog.grab_release()
+        self.task_dialog.withdraw()
+
+    def add_task_dialog(self):
+        self.editing_task_id = None
+        self.show_task_dialog("Add New Task", "Save")
 
     def edit_task_dialog(self):
         # Get selected item
@@ -374,91 +1019,67 @@ class TaskManagerGUI:
             messagebox.showinfo("Selection Required", "Please select a task to edit.")
             return
         
-        # Get task index (ID from tree - 1)
-        item_values = self.tree.item(selected_item[0], "values")
-        task_id = int(item_values[0]) - 1
+        # Tree item IDs are task ids
+        task_id = selected_item[0]
         
-        # Check if valid task index
-        if task_id < 0 or task_id >= len(self.task_manager.tasks):
+        # Get the task to edit
+        task = self.task_manager.get_task(task_id)
+        if task is None:
             messagebox.showerror("Error", "Invalid task selection.")
             return
         
-        # Get the task to edit
-        task = self.task_manager.tasks[task_id]
-        
-        # Create edit dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Edit Task")
-        dialog.geometry("400x300")
-        dialog.resizable(False, False)
-        dialog.transient(self.root)
-        dialog.grab_set()
-        
-        # Create form elements with current values
-        ttk.Label(dialog, text="Task Name:").grid(row=0, column=0, padx=10, pady=10, sticky=tk.W)
-        name_entry = ttk.Entry(dialog, width=30)
-        name_entry.insert(0, task.name)
-        name_entry.grid(row=0, column=1, padx=10, pady=10)
+        self.editing_task_id = task_id
+        self.show_task_dialog("Edit Task", "Update", task)
+
+    def submit_task_dialog(self):
+        # Get form values
+        name = self.name_entry.get().strip()
+        description = self.desc_entry.get("1.0", tk.END).strip()
+        priority = self.priority_combo.get()
+        due_date = self.date_entry.get().strip()
         
-        ttk.Label(dialog, text="Description:").grid(row=1, column=0, padx=10, pady=10, sticky=tk.W)
-        desc_entry = tk.Text(dialog, width=30, height=5)
-        desc_entry.insert("1.0", task.description)
-        desc_entry.grid(row=1, column=1, padx=10, pady=10)
+        # Validate input
+        if not name:
+            messagebox.showerror("Input Error", "Task name cannot be empty!")
+            return
         
-        ttk.Label(dialog, text="Priority:").grid(row=2, column=0, padx=10, pady=10, sticky=tk.W)
-        priority_combo = ttk.Combobox(dialog, values=["High", "Medium", "Low"], width=10)
-        priority_combo.set(task.priority)
-        priority_combo.grid(row=2, column=1, padx=10, pady=10, sticky=tk.W)
+        if not priority in ["High", "Medium", "Low"]:
+            messagebox.showerror("Input Error", "Invalid priority level!")
+            return
         
-        ttk.Label(dialog, text="Due Date (YYYY-MM-DD):").grid(row=3, column=0, padx=10, pady=10, sticky=tk.W)
-        date_entry = ttk.Entry(dialog, width=15)
-        date_entry.insert(0, task.due_date)
-        date_entry.grid(row=3, column=1, padx=10, pady=10, sticky=tk.W)
-        
-        def validate_and_update():
-            # Get form values
-            name = name_entry.get().strip()
-            description = desc_entry.get("1.0", tk.END).strip()
-            priority = priority_combo.get()
-            due_date = date_entry.get().strip()
-            
-            # Validate input
-            if not name:
-                messagebox.showerror("Input Error", "Task name cannot be empty!")
-                return
-            
-            if not priority in ["High", "Medium", "Low"]:
-                messagebox.showerror("Input Error", "Invalid priority level!")
-                return
-            
-            # Validate date format
-            try:
-                if due_date:
-                    datetime.strptime(due_date, "%Y-%m-%d")
-                else:
-                    messagebox.showerror("Input Error", "Due date cannot be empty!")
-                    return
-            except ValueError:
-                messagebox.showerror("Input Error", "Invalid date format! Use YYYY-MM-DD.")
+        # Validate date format
+        try:
+            if due_date:
+                parse_due_date(due_date)
+            else:
+                messagebox.showerror("Input Error", "Due date cannot be empty!")
                 return
+        except ValueError:
+            messagebox.showerror("Input Error", "Invalid date format! Use YYYY-MM-DD.")
+            return
+        
+        task_id = self.editing_task_id
+        if task_id is None:
+            # Create and add the task
+            new_task = Task(name, description, priority, due_date)
+            self.task_manager.add_task(new_task)
             
-            # Update the task
-            updated_task = Task(name, description, priority, due_date)
-            success = self.task_manager.update_task(task_id, updated_task)
-            
-            if success:
-                # Refresh the tree and close the dialog
-                self.populate_tree()
-                dialog.destroy()
-            else:
-                messagebox.showerror("Error", "Failed to update task.")
+            # Refresh the tree and close the dialog
+            self.insert_task_row(new_task)
+            self.hide_task_dialog()
+            return
         
-        # Add buttons
-        button_frame = ttk.Frame(dialog)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=20)
+        # Update the task
+        updated_task = Task(name, description, priority, due_date, task_id)
+        success = self.task_manager.update_task(task_id, updated_task)
         
-        ttk.Button(button_frame, text="Update", command=validate_and_update).pack(side=tk.LEFT, padx=10)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=10)
+        if success:
+            # Refresh the tree and close the dialog; an unchanged task keeps
+            # the original object
+            self.update_task_row(self.task_manager.get_task(task_id))
+            self.hide_task_dialog()
+        else:
+            messagebox.showerror("Error", "Failed to update task.")
 
     def delete_task(self):
         # Get selected item
@@ -467,10 +1088,9 @@ class TaskManagerGUI:
             messagebox.showinfo("Selection Required", "Please select a task to delete.")
             return
         
-        # Get task index (ID from tree - 1)
-        item_values = self.tree.item(selected_item[0], "values")
-        task_id = int(item_values[0]) - 1
-        task_name = item_values[1]
+        # Tree item IDs are task ids
+        task_id = selected_item[0]
+        task_name = self.tree.set(task_id, "Name")
         
         # Confirm deletion
         confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the task '{task_name}'?")
@@ -480,7 +1100,7 @@ class TaskManagerGUI:
             
             if success:
                 # Refresh the tree
-                self.populate_tree()
+                self.remove_task_row(task_id)
             else:
                 messagebox.showerror("Error", "Failed to delete task.")
 